@@ -5,6 +5,7 @@ from esgvoc.api.project_specs import (
     ProjectSpecs,
 )
 from esgvoc.api.projects import (
+    clear_caches,
     find_collections_in_project,
     find_items_in_project,
     find_terms_in_all_projects,
@@ -26,10 +27,15 @@ from esgvoc.api.projects import (
     get_terms_in_all_projects_by_key_value,
     get_terms_in_collection_by_key_value,
     get_terms_in_project_by_key_value,
+    precompile_project,
     valid_term,
     valid_term_in_all_projects,
     valid_term_in_collection,
     valid_term_in_project,
+    valid_terms_in_all_projects,
+    yield_all_terms_in_all_projects,
+    yield_all_terms_in_project,
+    yield_items_in_project,
 )
 from esgvoc.api.report import (
     ProjectTermError,
@@ -53,6 +59,7 @@ from esgvoc.api.universe import (
 )
 
 __all__ = [
+    "clear_caches",
     "DrsPart",
     "DrsSpecification",
     "DrsType",
@@ -88,6 +95,7 @@ __all__ = [
     "get_terms_in_collection_by_key_value",
     "get_terms_in_project_by_key_value",
     "MatchingTerm",
+    "precompile_project",
     "ProjectSpecs",
     "ProjectTermError",
     "UniverseTermError",
@@ -95,7 +103,11 @@ __all__ = [
     "valid_term_in_all_projects",
     "valid_term_in_collection",
     "valid_term_in_project",
+    "valid_terms_in_all_projects",
     "ValidationError",
     "ValidationErrorVisitor",
     "ValidationReport",
+    "yield_all_terms_in_all_projects",
+    "yield_all_terms_in_project",
+    "yield_items_in_project",
 ]
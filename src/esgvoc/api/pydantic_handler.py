@@ -1,7 +1,8 @@
-from functools import reduce
+import json
+from functools import lru_cache, reduce
 from typing import TYPE_CHECKING, Annotated, Any, Iterable, Type
 
-from pydantic import BaseModel, Discriminator, Tag, TypeAdapter
+from pydantic import BaseModel, Discriminator, Tag, TypeAdapter, ValidationError
 
 import esgvoc.core.constants as api_settings
 from esgvoc.core.exceptions import EsgvocDbError
@@ -25,35 +26,40 @@ def create_union(*classes: Type[BaseModel]):
     """
     classes_list = list(classes)
 
+    # [OPTIMIZATION]
+    # The required fields of each class are computed once, not for every discriminated value.
+    # Note: We include ALL required fields (even nullable ones) because pydantic
+    # requires fields without defaults to be present, regardless of nullability.
+    # This makes the discriminator strict and consistent across Python versions.
+    required_fields_by_class = [
+        (
+            cls.__name__,
+            frozenset(field_name for field_name, field_info in cls.model_fields.items() if field_info.is_required()),
+        )
+        for cls in classes_list
+    ]
+    # Tags of the instances of the classes of the union (e.g. revalidated models).
+    tag_by_class = {cls: cls.__name__ for cls in classes_list}
+
     def property_discriminator(v: Any) -> str:
         """Generic discriminator that checks which class has matching required fields."""
         if not isinstance(v, dict):
-            return v.__class__.__name__
+            return tag_by_class.get(type(v)) or v.__class__.__name__
 
         # Get the input fields
-        input_fields = set(v.keys())
-
-        # Track which models failed and why
-        failed_matches = []
+        input_fields = v.keys()
 
         # Try each class and see which one's required fields match
-        for cls in classes_list:
-            # Get required fields for this class
-            # Note: We include ALL required fields (even nullable ones) because pydantic
-            # requires fields without defaults to be present, regardless of nullability.
-            # This makes the discriminator strict and consistent across Python versions.
-            required_fields = {
-                field_name
-                for field_name, field_info in cls.model_fields.items()
-                if field_info.is_required()
-            }
-
+        for class_name, required_fields in required_fields_by_class:
             # Check if all required fields are present in input
-            missing_fields = required_fields - input_fields
-            if not missing_fields:
-                return cls.__name__
-            else:
-                failed_matches.append((cls.__name__, sorted(missing_fields)))
+            if required_fields <= input_fields:
+                return class_name
+
+        # Track which models failed and why (only computed when no model matched)
+        failed_matches = [
+            (class_name, sorted(required_fields - input_fields))
+            for class_name, required_fields in required_fields_by_class
+        ]
 
         # If no model matched, raise a helpful error
         error_parts = ["Could not discriminate union type. No model matched the input data."]
@@ -95,6 +101,92 @@ def get_pydantic_class(data_descriptor_id_or_term_type: str) -> type["DataDescri
         raise EsgvocDbError(f"'{data_descriptor_id_or_term_type}' pydantic class not found")
 
 
+@lru_cache(maxsize=None)
+def get_pydantic_type_adapter(term_type: str) -> TypeAdapter:
+    """
+    Get the TypeAdapter of the Pydantic class of the given term type.
+    The adapters are built once: building one costs far more than validating a term.
+
+    Args:
+        term_type: The type of the terms
+
+    Returns:
+        The TypeAdapter of the corresponding Pydantic DataDescriptor class (or union of classes)
+
+    Raises:
+        EsgvocDbError: If no matching pydantic class is found
+    """
+    return TypeAdapter(get_pydantic_class(term_type))
+
+
+@lru_cache(maxsize=None)
+def get_pydantic_list_type_adapter(term_type: str) -> TypeAdapter:
+    """
+    Get the TypeAdapter of a list of instances of the Pydantic class of the given term type.
+    Validating a list of terms in one call saves the overhead of one call per term.
+
+    Args:
+        term_type: The type of the terms
+
+    Returns:
+        The TypeAdapter of a list of the corresponding Pydantic DataDescriptor class (or union of classes)
+
+    Raises:
+        EsgvocDbError: If no matching pydantic class is found
+    """
+    return TypeAdapter(list[get_pydantic_class(term_type)])  # type: ignore[misc]
+
+
+@lru_cache(maxsize=256)
+def _get_term_subset_layout(selected_term_fields: tuple[str, ...]) -> tuple[tuple[str, ...], frozenset[str]]:
+    # [OPTIMIZATION]
+    # What only depends on the selected fields is decided once per selection, not for every term:
+    # the optional fields to remove and the fields to mark as set.
+    removed_fields = tuple(field for field in ("type", "description") if field not in selected_term_fields)
+    return removed_fields, frozenset(("id", *selected_term_fields))
+
+
+def instantiate_pydantic_term_subset(
+    term_id: str, term_type: str, term_fields: dict[str, Any], selected_term_fields: Iterable[str]
+) -> "DataDescriptorSubSet":
+    """
+    Instantiate a Pydantic DataDescriptorSubSet from the id, the type and some fields of a term.
+
+    Args:
+        term_id: The id of the term
+        term_type: The type of the term
+        term_fields: The selected fields that exist in the specifications of the term, with their values
+        selected_term_fields: The fields to include
+
+    Returns:
+        A DataDescriptorSubSet instance.
+    """
+    from esgvoc.api.data_descriptors.data_descriptor import DataDescriptorSubSet
+
+    selected_term_fields = tuple(selected_term_fields)
+    removed_fields, fields_set = _get_term_subset_layout(selected_term_fields)
+    # Build data dict with only id (truly mandatory) + selected fields, but only if they exist
+    data = {"id": term_id, **{field: term_fields[field] for field in selected_term_fields if field in term_fields}}
+
+    # Create instance with all fields initially
+    # We need type for validation, will remove it if not selected
+    if "type" not in data:
+        data["type"] = term_type
+    if "description" not in data:
+        data["description"] = ""  # Use default value
+
+    # Mark which fields were actually set
+    subset = DataDescriptorSubSet.model_construct(_fields_set=set(fields_set), **data)
+
+    # Now remove unselected optional fields
+    # This maintains backward compatibility (hasattr will return False)
+    # They are removed from the instance dict: same result as delattr, without its checks.
+    for field in removed_fields:
+        del subset.__dict__[field]
+
+    return subset
+
+
 def instantiate_pydantic_term(
     term: "UTerm | PTerm", selected_term_fields: Iterable[str] | None
 ) -> "DataDescriptor | DataDescriptorSubSet":
@@ -109,42 +201,30 @@ def instantiate_pydantic_term(
         A DataDescriptor instance (full model) when selected_term_fields is None,
         or a DataDescriptorSubSet instance when selected_term_fields is provided.
     """
-    from esgvoc.api.data_descriptors.data_descriptor import DataDescriptorSubSet
-
     type = term.specs[api_settings.TERM_TYPE_JSON_KEY]
     if selected_term_fields is not None:
-        # Build data dict with only id (truly mandatory) + selected fields
-        data = {
-            "id": term.id,
-        }
-
-        # Add selected fields from term.specs, but only if they exist
-        for field in selected_term_fields:
-            if field in term.specs:
-                data[field] = term.specs[field]
-
-        # Create instance with all fields initially
-        # We need type for validation, will remove it if not selected
-        if "type" not in data:
-            data["type"] = type
-        if "description" not in data:
-            data["description"] = ""  # Use default value
-
-        subset = DataDescriptorSubSet.model_construct(**data)
-
-        # Now remove unselected optional fields using delattr
-        # This maintains backward compatibility (hasattr will return False)
-        if "type" not in selected_term_fields and hasattr(subset, "type"):
-            delattr(subset, "type")
-        if "description" not in selected_term_fields and hasattr(subset, "description"):
-            delattr(subset, "description")
-
-        # Mark which fields were actually set
-        subset.__pydantic_fields_set__ = {"id"} | set(selected_term_fields)
-
-        return subset
+        return instantiate_pydantic_term_subset(term.id, type, term.specs, selected_term_fields)
     else:
-        term_class = get_pydantic_class(type)
-
-        adapter = TypeAdapter(term_class)
+        adapter = get_pydantic_type_adapter(type)
         return adapter.validate_python(term.specs)
+
+
+def instantiate_pydantic_term_from_json(term_type: str, term_specs: str | bytes) -> "DataDescriptor":
+    """
+    Instantiate a Pydantic DataDescriptor from the JSON specifications of a term, as stored in the database.
+    The JSON is parsed by pydantic while validating, which is much faster than decoding it first.
+
+    Args:
+        term_type: The type of the term
+        term_specs: The JSON specifications of the term
+
+    Returns:
+        A DataDescriptor instance (full model).
+    """
+    adapter = get_pydantic_type_adapter(term_type)
+    try:
+        return adapter.validate_json(term_specs)
+    except ValidationError:
+        # The JSON mode is a little stricter than the Python mode for some types:
+        # the term is validated (or rejected) the same way as instantiate_pydantic_term does.
+        return adapter.validate_python(json.loads(term_specs))
@@ -1,8 +1,10 @@
 from enum import Enum
-from typing import Any, Iterable, MutableSequence, Sequence
+from functools import lru_cache
+from itertools import groupby
+from typing import Any, Iterable, Iterator, MutableSequence, Sequence
 
 import sqlalchemy as sa
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from sqlalchemy import ColumnElement
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.sql.expression import Select
@@ -10,7 +12,7 @@ from sqlalchemy.sql.selectable import ExecutableReturnsRows
 from sqlmodel import Column, Field, Session, col
 
 from esgvoc.api.data_descriptors.data_descriptor import DataDescriptor
-from esgvoc.api.pydantic_handler import instantiate_pydantic_term
+from esgvoc.api.pydantic_handler import get_pydantic_list_type_adapter, instantiate_pydantic_term
 from esgvoc.core.db.models.project import PCollectionFTS5, PTerm, PTermFTS5
 from esgvoc.core.db.models.universe import UDataDescriptorFTS5, UTerm, UTermFTS5
 from esgvoc.core.exceptions import EsgvocDbError, EsgvocValueError
@@ -36,8 +38,18 @@ class Item(BaseModel):
     """The id of the parent of the item."""
 
 
+# [OPTIMIZATION]
+# The items found are validated all at once (see _instantiate_items).
+_ITEMS_ADAPTER = TypeAdapter(list[Item])
+
+
+def _instantiate_items(rows: Iterable[Sequence]) -> list[Item]:
+    # The rows are an id, a kindness and a parent id (first columns).
+    return _ITEMS_ADAPTER.validate_python([{"id": r[0], "kind": r[1], "parent_id": r[2]} for r in rows])
+
+
 def get_universe_session() -> Session:
-    from esgvoc.core.db.connection import DBConnection
+    from esgvoc.core.db.connection import get_pooled_connection
     from esgvoc.core.service.user_state import UserState
 
     state = UserState.load()
@@ -45,7 +57,7 @@ def get_universe_session() -> Session:
     if active:
         db_path = UserState.db_path("universe", active)
         if db_path.exists():
-            return DBConnection(db_path).create_session()
+            return get_pooled_connection(db_path).create_session()
     raise EsgvocDbError(
         "Universe database is not installed or active.\n"
         "Run: esgvoc use universe@latest"
@@ -56,6 +68,30 @@ def instantiate_pydantic_terms(
     db_terms: Iterable[UTerm | PTerm],
     list_to_populate: MutableSequence[DataDescriptor],
     selected_term_fields: Iterable[str] | None,
+) -> None:
+    if selected_term_fields is None:
+        # [OPTIMIZATION]
+        # The consecutive terms of the same type are validated with one call. If one of them is invalid,
+        # they are instantiated one by one so as to report the faulty term.
+        for term_type, terms_of_type in groupby(db_terms, key=lambda db_term: db_term.specs.get("type")):
+            terms_of_type = list(terms_of_type)
+            try:
+                terms = get_pydantic_list_type_adapter(term_type).validate_python(
+                    [db_term.specs for db_term in terms_of_type]
+                )
+            except (ValidationError, EsgvocDbError):
+                # Invalid term or unknown type.
+                _instantiate_pydantic_terms_one_by_one(terms_of_type, list_to_populate, selected_term_fields)
+            else:
+                list_to_populate.extend(terms)
+    else:
+        _instantiate_pydantic_terms_one_by_one(db_terms, list_to_populate, selected_term_fields)
+
+
+def _instantiate_pydantic_terms_one_by_one(
+    db_terms: Iterable[UTerm | PTerm],
+    list_to_populate: MutableSequence[DataDescriptor],
+    selected_term_fields: Iterable[str] | None,
 ) -> None:
     for db_term in db_terms:
         try:
@@ -68,6 +104,9 @@ def instantiate_pydantic_terms(
             raise ValueError(f"Failed to instantiate term with ID: '{db_term.id}', type: '{term_type}', data_descriptor: '{dd_id}'. Original error: {e}") from e
 
 
+# [OPTIMIZATION]
+# Same expressions are searched again and again (e.g. in every project): they are processed once.
+@lru_cache(maxsize=256)
 def process_expression(expression: str) -> str:
     """
     Allows only SQLite FST operators AND OR NOT and perform prefix search for single word expressions.
@@ -94,6 +133,9 @@ def process_expression(expression: str) -> str:
     return result
 
 
+# [OPTIMIZATION]
+# The conditions do not depend on the session (SQLAlchemy expressions are immutable): they are built once.
+@lru_cache(maxsize=256)
 def generate_matching_condition(
     cls: type[UTermFTS5] | type[UDataDescriptorFTS5] | type[PTermFTS5] | type[PCollectionFTS5],
     expression: str,
@@ -120,9 +162,22 @@ def handle_rank_limit_offset(statement: Select, limit: int | None, offset: int |
     return statement
 
 
-def execute_match_statement(expression: str, statement: ExecutableReturnsRows, session: Session) -> Sequence:
+def get_rank_limit_offset_params(limit: int | None, offset: int | None) -> dict[str, int]:
+    """
+    Returns the values of the :limit and :offset parameters of a textual statement, with the same
+    meaning as handle_rank_limit_offset (-1 means no limit for SQLite).
+    """
+    return {
+        "limit": limit if limit and limit > 0 else -1,
+        "offset": offset if offset and offset > 0 else 0,
+    }
+
+
+def execute_match_statement(
+    expression: str, statement: ExecutableReturnsRows, session: Session, params: dict[str, Any] | None = None
+) -> Sequence:
     try:
-        raw_results = session.exec(statement)  # type: ignore
+        raw_results = session.exec(statement, params=params)  # type: ignore
         # raw_results.all() returns a list of sqlalquemy rows.
         results = [result[0] for result in raw_results.all()]
         return results
@@ -130,41 +185,78 @@ def execute_match_statement(expression: str, statement: ExecutableReturnsRows, s
         raise EsgvocValueError(f"unable to interpret expression '{expression}'") from e
 
 
+def get_find_items_top(limit: int | None, offset: int | None) -> int | None:
+    """
+    Returns the number of the best items that execute_find_item_statements can return
+    (`None` for all of them): its statements need not return more.
+    """
+    if limit and limit > 0:  # False if == 0 and is None ; True if != 0 and is not None.
+        return limit + offset if offset and offset > 0 else limit
+    return None
+
+
+def get_find_items_top_params(limit: int | None, offset: int | None) -> dict[str, int]:
+    """
+    Returns the values of the `top` (LIMIT of the searches, -1 that is no limit for all the items) and
+    `start` (OFFSET) parameters of the statements of execute_find_item_statements.
+    """
+    top = get_find_items_top(limit, offset)
+    return {"top": -1 if top is None else top, "start": offset if offset and offset > 0 else 0}
+
+
+def union_find_item_statements(first_statement: Select, second_statement: Select) -> sa.CompoundSelect:
+    """
+    Returns the single statement of find items made of the given statements, which select an id, a kind,
+    a parent id, a rank and a position (rowid) each.
+    The items are sorted according to the bm25 ranking metric, the ties by kind and position,
+    then framed by the `top` and `start` parameters (see get_find_items_top_params).
+    """
+    # [OPTIMIZATION]
+    # One query (one statement setup and one result iteration) instead of one per kind of items, merged and sorted
+    # in Python. SQLite does not allow ORDER BY or LIMIT in the members of a compound select: they are subqueries.
+    first, second = first_statement.subquery("first_found"), second_statement.subquery("second_found")
+    top, start = sa.bindparam("top", type_=sa.Integer), sa.bindparam("start", type_=sa.Integer)
+    # According to https://sqlite.org/fts5.html#the_bm25_function,
+    # "the better matches are assigned numerically lower scores."
+    # If there is no limit, top - start is still negative (no limit for SQLite).
+    return (
+        sa.union_all(sa.select(*first.c), sa.select(*second.c))
+        .order_by(sa.literal_column("rank"), sa.literal_column("kind"), sa.literal_column("position"))
+        .limit(top - start)
+        .offset(start)
+    )
+
+
 def execute_find_item_statements(
-    session: Session,
-    expression: str,
-    first_statement: Select,
-    second_statement: Select,
-    limit: int | None,
-    offset: int | None,
+    session: Session, expression: str, statement: ExecutableReturnsRows, params: dict[str, Any]
 ) -> list[Item]:
     try:
-        # Items found are kind of tuple with an object, a kindness, a parent id and a rank.
-        first_statement_found = session.exec(first_statement).all()  # type: ignore
-        second_statement_found = session.exec(second_statement).all()  # type: ignore
-        tmp_result: list[Any] = list()
-        tmp_result.extend(first_statement_found)
-        tmp_result.extend(second_statement_found)
-        # According to https://sqlite.org/fts5.html#the_bm25_function,
-        # "the better matches are assigned numerically lower scores."
-        # Sort on the rank column (index 3).
-        sorted_tmp_result = sorted(tmp_result, key=lambda r: r[3], reverse=False)
-        if offset and offset > 0:  # False if == 0 and is None ; True if != 0 and is not None.
-            start = offset
-        else:
-            start = 0
-        if limit and limit > 0:  # False if == 0 and is None ; True if != 0 and is not None.
-            stop = start + limit
-            # is OK if stop > len of the list.
-            framed_tmp_result = sorted_tmp_result[start:stop]
-        else:
-            framed_tmp_result = sorted_tmp_result[start:]
-        result = [Item(id=r[0], kind=r[1], parent_id=r[2]) for r in framed_tmp_result]
+        # Items found are kind of tuple with an object, a kindness, a parent id, a rank and a position
+        # (see union_find_item_statements).
+        # [OPTIMIZATION]
+        # Executed on the connection of the session: the rows are plain tuples and skip the ORM processing.
+        found = session.connection().execute(statement, params).all()
+        result = _instantiate_items(found)
     except OperationalError as e:
         raise EsgvocValueError(f"unable to interpret expression '{expression}'") from e
     return result
 
 
+def yield_find_items(
+    session: Session, expression: str, statement: ExecutableReturnsRows, params: dict[str, Any], yield_per: int
+) -> Iterator[Item]:
+    """
+    Same as execute_find_item_statements, but the items are fetched by batches of `yield_per` rows
+    and instantiated one by one, as the iteration goes.
+    """
+    try:
+        result = session.connection().execute(statement.execution_options(yield_per=yield_per), params)
+        for rows in result.partitions():
+            yield from _instantiate_items(rows)
+    except OperationalError as e:
+        raise EsgvocValueError(f"unable to interpret expression '{expression}'") from e
+
+
 class MatchingTerm(BaseModel):
     """
     Place holder for a term that matches a value (term validation).
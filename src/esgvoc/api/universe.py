@@ -1,6 +1,7 @@
+from functools import lru_cache
 from typing import Iterable, Sequence
 
-from sqlalchemy import text
+from sqlalchemy import CompoundSelect, Integer, String, bindparam, literal_column
 from sqlmodel import Session, col, select
 
 from esgvoc.api.data_descriptors.data_descriptor import DataDescriptor, DataDescriptorSubSet
@@ -10,10 +11,12 @@ from esgvoc.api.search import (
     execute_find_item_statements,
     execute_match_statement,
     generate_matching_condition,
+    get_find_items_top_params,
     get_universe_session,
     handle_rank_limit_offset,
     instantiate_pydantic_terms,
     process_expression,
+    union_find_item_statements,
 )
 from esgvoc.core.db.models.universe import UDataDescriptor, UDataDescriptorFTS5, UTerm, UTermFTS5
 
@@ -101,7 +104,13 @@ def get_all_terms_in_universe(selected_term_fields: Iterable[str] | None = None)
 
 
 def _get_term_in_data_descriptor(data_descriptor_id: str, term_id: str, session: Session) -> UTerm | None:
-    statement = select(UTerm).join(UDataDescriptor).where(UDataDescriptor.id == data_descriptor_id, UTerm.id == term_id)
+    # Term ids are unique within a data descriptor: let SQLite stop at the first match.
+    statement = (
+        select(UTerm)
+        .join(UDataDescriptor)
+        .where(UDataDescriptor.id == data_descriptor_id, UTerm.id == term_id)
+        .limit(1)
+    )
     results = session.exec(statement)
     result = results.one_or_none()
     return result
@@ -138,7 +147,8 @@ def get_term_in_data_descriptor(
 
 
 def _get_term_in_universe(term_id: str, session: Session) -> UTerm | None:
-    statement = select(UTerm).where(UTerm.id == term_id)
+    # Only the first row is read: let SQLite stop at the first match.
+    statement = select(UTerm).where(UTerm.id == term_id).limit(1)
     results = session.exec(statement)
     result = results.first()  # Term ids are not supposed to be unique within the universe.
     return result
@@ -321,8 +331,12 @@ def _find_terms_in_data_descriptor(
     offset: int | None = None,
 ) -> Sequence[UTerm]:
     matching_condition = generate_matching_condition(UTermFTS5, expression, only_id)
-    where_condition = UDataDescriptor.id == data_descriptor_id, matching_condition
-    tmp_statement = select(UTermFTS5).join(UDataDescriptor).where(*where_condition)
+    # [OPTIMIZATION]
+    # The data descriptor is an uncorrelated list subquery (evaluated once) rather than a join, so that the FTS5
+    # table stays the only scanned table and its MATCH and rank ordering are never re-run per data descriptor row.
+    data_descriptor_pks = select(UDataDescriptor.pk).where(UDataDescriptor.id == data_descriptor_id)
+    where_condition = matching_condition, col(UTermFTS5.data_descriptor_pk).in_(data_descriptor_pks)
+    tmp_statement = select(UTermFTS5).where(*where_condition)
     statement = select(UTerm).from_statement(handle_rank_limit_offset(tmp_statement, limit, offset))
     return execute_match_statement(expression, statement, session)
 
@@ -380,6 +394,49 @@ def find_terms_in_data_descriptor(
     return result
 
 
+@lru_cache(maxsize=None)
+def _get_find_items_statement(only_id: bool) -> CompoundSelect:
+    # [OPTIMIZATION]
+    # Same statement as find_items_in_project (built once, parameters :expression, :top and :start): one query,
+    # ordered by rank (ties by rowid), limited to the best (offset + limit) items of each kind and the terms
+    # matched before the join.
+    if only_id:
+        dd_column = col(UDataDescriptorFTS5.id)
+        term_column = col(UTermFTS5.id)
+    else:
+        dd_column = col(UDataDescriptorFTS5.id)  # TODO: use specs when implemented!
+        term_column = col(UTermFTS5.specs)  # type: ignore
+    expression, top = bindparam("expression", type_=String), bindparam("top", type_=Integer)
+    rank, rowid = literal_column("rank"), literal_column("rowid")
+    dd_statement = (
+        select(
+            col(UDataDescriptorFTS5.id).label("id"),
+            literal_column("'data_descriptor'").label("kind"),
+            literal_column("'universe'").label("parent_id"),
+            rank.label("rank"),
+            rowid.label("position"),
+        )
+        .where(dd_column.match(expression))
+        .order_by(rank, rowid)
+        .limit(top)
+    )
+    terms_found = (
+        select(col(UTermFTS5.id), col(UTermFTS5.data_descriptor_pk), rank.label("rank"), rowid.label("position"))
+        .where(term_column.match(expression))
+        .order_by(rank, rowid)
+        .limit(top)
+        .cte("terms_found")
+    )
+    term_statement = select(
+        terms_found.c.id.label("id"),
+        literal_column("'term'").label("kind"),
+        col(UDataDescriptor.id).label("parent_id"),
+        terms_found.c.rank,
+        terms_found.c.position,
+    ).join_from(terms_found, UDataDescriptor, UDataDescriptor.pk == terms_found.c.data_descriptor_pk)
+    return union_find_item_statements(dd_statement, term_statement)
+
+
 def find_items_in_universe(
     expression: str, only_id: bool = False, limit: int | None = None, offset: int | None = None
 ) -> list[Item]:
@@ -417,27 +474,9 @@ def find_items_in_universe(
     :rtype: list[Item]
     :raises EsgvocValueError: If the `expression` cannot be interpreted.
     """
-    # TODO: execute union query when it will be possible to compute parent of terms and data descriptors.
     result = list()
     with get_universe_session() as session:
         processed_expression = process_expression(expression)
-        if only_id:
-            dd_column = col(UDataDescriptorFTS5.id)
-            term_column = col(UTermFTS5.id)
-        else:
-            dd_column = col(UDataDescriptorFTS5.id)  # TODO: use specs when implemented!
-            term_column = col(UTermFTS5.specs)  # type: ignore
-        dd_where_condition = dd_column.match(processed_expression)
-        dd_statement = select(
-            UDataDescriptorFTS5.id, text("'data_descriptor' AS TYPE"), text("'universe' AS TYPE"), text("rank")
-        ).where(dd_where_condition)
-        term_where_condition = term_column.match(processed_expression)
-        term_statement = (
-            select(UTermFTS5.id, text("'term' AS TYPE"), UDataDescriptor.id, text("rank"))
-            .join(UDataDescriptor)
-            .where(term_where_condition)
-        )
-        result = execute_find_item_statements(
-            session, processed_expression, dd_statement, term_statement, limit, offset
-        )
+        params = {"expression": processed_expression, **get_find_items_top_params(limit, offset)}
+        result = execute_find_item_statements(session, processed_expression, _get_find_items_statement(only_id), params)
         return result
@@ -264,6 +264,15 @@ def ingest_project(
             _LOGGER.fatal(msg)
             raise EsgvocDbError(msg) from e
         project_db_session.commit()
+        # [OPTIMIZATION]
+        # Gather the statistics of the indexes, so that the query planner chooses the most selective one.
+        try:
+            project_db_session.exec(text("ANALYZE;"))  # type: ignore
+        except Exception as e:
+            msg = f"unable to analyze {project_db_file_path}"
+            _LOGGER.fatal(msg)
+            raise EsgvocDbError(msg) from e
+        project_db_session.commit()
 
         if total_errors > 0:
             _LOGGER.error(
@@ -44,12 +44,40 @@ import os
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from esgvoc.core.service.configuration.home import EsgvocHome
 
 _LOGGER = logging.getLogger(__name__)
 
+# [OPTIMIZATION]
+# Project ids of the last scan of the dbs directory, with the modification times it was made from.
+_PROJECT_IDS_CACHE: dict[Path, tuple[tuple, list[str]]] = {}
+
+# [OPTIMIZATION]
+# Content of each pointer file, with the signature (modification time, size, inode) of the file it was read from.
+_POINTERS_CACHE: dict[Path, tuple[tuple[int, int, int], Optional[dict]]] = {}
+
+# Callables notified with the id of the project whose databases change in this process.
+_STATE_CHANGE_LISTENERS: list[Callable[[str], None]] = []
+
+
+def add_state_change_listener(listener: Callable[[str], None]) -> None:
+    """
+    Register *listener* so that it is called with the project id every time the active
+    version of a project changes or one of its DB files is removed (e.g. to drop caches).
+    """
+    if listener not in _STATE_CHANGE_LISTENERS:
+        _STATE_CHANGE_LISTENERS.append(listener)
+
+
+def _notify_state_change(project_id: str) -> None:
+    for listener in _STATE_CHANGE_LISTENERS:
+        try:
+            listener(project_id)
+        except Exception as e:
+            _LOGGER.warning("State change listener %r failed for %s: %s", listener, project_id, e)
+
 
 def _dbs_dir() -> Path:
     """Resolve dbs directory: ESGVOC_DB_DIR env var or EsgvocHome default."""
@@ -73,6 +101,30 @@ def _pointer_file(project_id: str) -> Path:
     return _dbs_dir() / f"{project_id}.active.json"
 
 
+def _read_pointer(pointer: Path) -> Optional[dict]:
+    """Return the content of the *pointer* file, or None if it does not exist or is corrupt."""
+    # The pointer files are read on every resolution of a project database: they are parsed again
+    # only when they change (they are replaced atomically, see _atomic_write).
+    try:
+        stat = pointer.stat()
+    except FileNotFoundError:
+        return None
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = _POINTERS_CACHE.get(pointer)
+    if cached is None or cached[0] != signature:
+        try:
+            data = json.loads(pointer.read_text())
+            if not isinstance(data, dict):
+                raise ValueError("not a JSON object")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            _LOGGER.warning("Corrupt pointer file %s: %s", pointer, e)
+            data = None
+        cached = _POINTERS_CACHE[pointer] = (signature, data)
+    return cached[1]
+
+
 def _atomic_write(path: Path, content: str) -> None:
     """Write *content* to *path* atomically via a temp file."""
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -140,39 +192,18 @@ class UserState:
 
     def get_active(self, project_id: str) -> Optional[str]:
         """Return the active name (e.g. 'v2.1.0', 'my-experiment') or None."""
-        pointer = _pointer_file(project_id)
-        if not pointer.exists():
-            return None
-        try:
-            data = json.loads(pointer.read_text())
-            return data.get("active")
-        except Exception as e:
-            _LOGGER.warning("Corrupt pointer file %s: %s", pointer, e)
-            return None
+        data = _read_pointer(_pointer_file(project_id))
+        return data.get("active") if data else None
 
     def get_active_source(self, project_id: str) -> Optional[str]:
         """Return 'registry' or 'local' for the active version, or None."""
-        pointer = _pointer_file(project_id)
-        if not pointer.exists():
-            return None
-        try:
-            data = json.loads(pointer.read_text())
-            return data.get("source")
-        except Exception as e:
-            _LOGGER.warning("Corrupt pointer file %s: %s", pointer, e)
-            return None
+        data = _read_pointer(_pointer_file(project_id))
+        return data.get("source") if data else None
 
     def get_active_checksum(self, project_id: str) -> Optional[str]:
         """Return the stored checksum for the active version, or None."""
-        pointer = _pointer_file(project_id)
-        if not pointer.exists():
-            return None
-        try:
-            data = json.loads(pointer.read_text())
-            return data.get("checksum")
-        except Exception as e:
-            _LOGGER.warning("Corrupt pointer file %s: %s", pointer, e)
-            return None
+        data = _read_pointer(_pointer_file(project_id))
+        return data.get("checksum") if data else None
 
     def set_active(
         self,
@@ -187,10 +218,12 @@ class UserState:
         if checksum:
             data["checksum"] = checksum
         _atomic_write(pointer, json.dumps(data, indent=2))
+        _notify_state_change(project_id)
 
     def remove_active(self, project_id: str) -> None:
         """Delete the pointer file for *project_id* (no active version)."""
         _pointer_file(project_id).unlink(missing_ok=True)
+        _notify_state_change(project_id)
 
     # ------------------------------------------------------------------
     # Installed versions (filesystem-driven)
@@ -216,6 +249,8 @@ class UserState:
         """Delete the DB file from disk.  Also clears the pointer if it was active."""
         db = self.db_path(project_id, name)
         if db.exists():
+            # Notified first so that the listeners release their connections to the file.
+            _notify_state_change(project_id)
             db.unlink()
         # Clear pointer if this was the active version
         if self.get_active(project_id) == name:
@@ -226,7 +261,17 @@ class UserState:
         dbs = _dbs_dir()
         if not dbs.exists():
             return []
-        return [p.name for p in sorted(dbs.iterdir()) if p.is_dir() and any(p.glob("*.db"))]
+        # Adding or removing a DB file changes the modification time of its directory:
+        # the subdirs are only scanned again when one of these times changes.
+        with os.scandir(dbs) as entries:
+            signature = tuple(
+                sorted((entry.name, entry.stat().st_mtime_ns) for entry in entries if entry.is_dir())
+            )
+        cached = _PROJECT_IDS_CACHE.get(dbs)
+        if cached is None or cached[0] != signature:
+            project_ids = [p.name for p in sorted(dbs.iterdir()) if p.is_dir() and any(p.glob("*.db"))]
+            cached = _PROJECT_IDS_CACHE[dbs] = (signature, project_ids)
+        return list(cached[1])
 
     # ------------------------------------------------------------------
     # DB paths
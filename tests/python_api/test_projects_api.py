@@ -80,6 +80,14 @@ class TestGetAllTermsInProject:
         terms_v1 = projects.get_all_terms_in_project("cmip7", version="v1.0.0")
         assert len(terms_default) == len(terms_v1)
 
+    def test_yield_matches_list(self, installed_dbs):
+        import esgvoc.api.projects as projects
+
+        for selected_term_fields in (None, ["drs_name"]):
+            terms = projects.get_all_terms_in_project("cmip7", selected_term_fields)
+            yielded = list(projects.yield_all_terms_in_project("cmip7", selected_term_fields))
+            assert [term.model_dump() for term in yielded] == [term.model_dump() for term in terms]
+
 
 class TestGetAllTermsInCollection:
     def test_returns_terms_in_collection(self, installed_dbs):
@@ -117,6 +125,18 @@ class TestGetTermInProject:
         result = projects.get_term_in_project("cmip7", "nonexistent_term_xyz", [])
         assert result is None
 
+    def test_cached_term_is_a_copy(self, installed_dbs):
+        import esgvoc.api.projects as projects
+
+        terms = projects.get_all_terms_in_project("cmip7")
+        if not terms:
+            pytest.skip("No terms in cmip7")
+        term_id = terms[0].id
+        first = projects.get_term_in_project("cmip7", term_id)
+        first.id = "modified_by_the_caller"
+        second = projects.get_term_in_project("cmip7", term_id)
+        assert second is not None and second.id == term_id
+
 
 class TestValidation:
     def test_valid_term_in_project(self, installed_dbs):
@@ -137,6 +157,39 @@ class TestValidation:
         result = projects.valid_term_in_project("this_value_definitely_does_not_exist_xyz_abc_123", "cmip7")
         assert result == []
 
+    def test_precompile_project_keeps_results(self, installed_dbs):
+        import esgvoc.api.projects as projects
+
+        projects.clear_caches()
+        before = projects.valid_term_in_project("r1i1p1f1", "cmip7")
+        projects.clear_caches()
+        projects.precompile_project("cmip7")
+        assert projects.valid_term_in_project("r1i1p1f1", "cmip7") == before
+
+    def test_clear_caches_of_project(self, installed_dbs):
+        import esgvoc.api.projects as projects
+
+        before = projects.valid_term_in_project("r1i1p1f1", "cmip7")
+        assert any(projects._is_project_db_key(key, "cmip7") for key in projects._COLLECTIONS_CACHE)
+        projects.clear_caches("cmip7")
+        assert not any(projects._is_project_db_key(key, "cmip7") for key in projects._COLLECTIONS_CACHE)
+        assert projects.valid_term_in_project("r1i1p1f1", "cmip7") == before
+
+    def test_clear_caches_disposes_pooled_connections(self, installed_dbs):
+        import esgvoc.api.projects as projects
+
+        connection = projects._get_project_connection("cmip7")
+        assert projects._get_project_connection("cmip7") is connection
+        projects.clear_caches("cmip7")
+        assert projects._get_project_connection("cmip7") is not connection
+
+    def test_precompile_unknown_project_raises(self, installed_dbs):
+        import esgvoc.api.projects as projects
+        from esgvoc.core.exceptions import EsgvocNotFoundError
+
+        with pytest.raises(EsgvocNotFoundError):
+            projects.precompile_project("nonexistent_xyz")
+
 
 class TestGetAllTermsInAllProjects:
     def test_returns_grouped_results(self, installed_dbs):
@@ -267,6 +320,22 @@ class TestGetCollectionFromDataDescriptor:
         result = projects.get_collection_from_data_descriptor_in_all_projects("nonexistent_dd_xyz_abc")
         assert result == [] or result is None
 
+    def test_all_projects_matches_each_project(self, installed_dbs):
+        import esgvoc.api.projects as projects
+
+        collections = projects.get_all_collections_in_project("cmip7")
+        if not collections:
+            pytest.skip("No collections in cmip7")
+        dd = projects.get_data_descriptor_from_collection_in_project("cmip7", collections[0])
+        if dd is None:
+            pytest.skip("First collection has no linked data descriptor")
+        projects.clear_caches()
+        result = projects.get_collection_from_data_descriptor_in_all_projects(dd)
+        projects.clear_caches()
+        for project_id in projects.get_all_projects():
+            expected = projects.get_collection_from_data_descriptor_in_project(project_id, dd)
+            assert [(coll_id, context) for proj_id, coll_id, context in result if proj_id == project_id] == expected
+
 
 class TestGetTermFromUniverseTermId:
     def test_get_term_from_universe_id_in_project(self, installed_dbs):
@@ -395,6 +464,15 @@ class TestValidTermFull:
         non_freetext = [m for m in result if m.term_id != "freetext"]
         assert non_freetext == []
 
+    def test_valid_terms_in_all_projects_matches_each_value(self, installed_dbs):
+        import esgvoc.api.projects as projects
+
+        values = ["mon", "r1i1p1f1", "this_value_certainly_does_not_match_xyz_123", "mon"]
+        results = projects.valid_terms_in_all_projects(values)
+        assert list(results) == values[:3]
+        for value, matching_terms in results.items():
+            assert matching_terms == projects.valid_term_in_all_projects(value)
+
 
 class TestValidTermInCollection:
     def test_valid_term_in_collection_match(self, installed_dbs):
@@ -568,6 +646,27 @@ class TestFindTermsInAllProjects:
             all_found.extend(project_terms)
         assert all_found == []
 
+    def test_find_in_attached_projects_matches_each_project(self, installed_dbs):
+        import esgvoc.api.projects as projects
+
+        projects.clear_caches()
+        results = projects.find_terms_in_all_projects("mon", limit=5)
+        projects.clear_caches()
+        for project_id, project_terms in results:
+            assert project_terms == projects.find_terms_in_project("mon", project_id, limit=5)
+
+    def test_greedy_limits_all_the_terms_found(self, installed_dbs):
+        import esgvoc.api.projects as projects
+
+        all_found = [
+            (project_id, term.id)
+            for project_id, project_terms in projects.find_terms_in_all_projects("mon")
+            for term in project_terms
+        ]
+        results = projects.find_terms_in_all_projects("mon", limit=3, offset=1, greedy=True)
+        found = [(project_id, term.id) for project_id, project_terms in results for term in project_terms]
+        assert found == all_found[1:4]
+
 
 class TestLimitOffset:
     def test_find_terms_with_limit(self, installed_dbs):
@@ -641,6 +740,25 @@ class TestFindItemsInProject:
         results = projects.find_items_in_project("zzzzxqjk_nonexistent_xyz", "cmip7")
         assert results == [] or results is None
 
+    @pytest.mark.parametrize("limit, offset", [(None, None), (5, 2)])
+    def test_yield_items_matches_find_items(self, installed_dbs, limit, offset):
+        import esgvoc.api.projects as projects
+
+        expected = projects.find_items_in_project("source", "cmip7", limit=limit, offset=offset)
+        yielded = list(projects.yield_items_in_project("source", "cmip7", limit=limit, offset=offset))
+        assert yielded == expected
+
+    def test_cached_items_are_not_shared_with_callers(self, installed_dbs):
+        import esgvoc.api.projects as projects
+
+        first = projects.find_items_in_project("source", "cmip7")
+        if not first:
+            pytest.skip("No item found in cmip7")
+        expected = [item.model_copy() for item in first]
+        first[0].id = "modified"
+        first.clear()
+        assert projects.find_items_in_project("source", "cmip7") == expected
+
 
 class TestGetDataDescriptorFromCollection:
     def test_returns_string_for_known_collection(self, installed_dbs):
@@ -690,6 +808,19 @@ class TestGetTermsByKeyValue:
                 return
         pytest.skip("No term with drs_name found in cmip7")
 
+    def test_get_terms_in_collection_by_key_value_with_escaped_characters(self, installed_dbs):
+        import esgvoc.api.projects as projects
+
+        # Regexes contain backslashes, escaped in the JSON specs.
+        for coll in projects.get_all_collections_in_project("cmip7"):
+            for term in projects.get_all_terms_in_collection("cmip7", coll):
+                regex = getattr(term, "regex", None)
+                if isinstance(regex, str) and "\\" in regex:
+                    result = projects.get_terms_in_collection_by_key_value("cmip7", coll, "regex", regex)
+                    assert term.id in [found.id for found in result]
+                    return
+        pytest.skip("No term with an escaped regex found in cmip7")
+
     def test_get_terms_in_collection_by_key_value_not_found(self, installed_dbs):
         import esgvoc.api.projects as projects
 
@@ -759,6 +890,19 @@ class TestGetTermsByKeyValue:
         result = projects.get_terms_in_all_projects_by_key_value("drs_name", "NON_EXISTENT_VALUE_12345_XYZ")
         assert result == []
 
+    def test_get_terms_in_all_projects_by_key_value_matches_each_project(self, installed_dbs):
+        import esgvoc.api.projects as projects
+
+        terms = projects.get_all_terms_in_project("cmip7")
+        drs_name = next((term.drs_name for term in terms if getattr(term, "drs_name", None)), None)
+        if drs_name is None:
+            pytest.skip("No term with drs_name found in cmip7")
+        projects.clear_caches()
+        results = dict(projects.get_terms_in_all_projects_by_key_value("drs_name", str(drs_name)))
+        for project_id in projects.get_all_projects():
+            expected = projects.get_terms_in_project_by_key_value(project_id, "drs_name", str(drs_name))
+            assert results.get(project_id, []) == expected
+
     def test_get_terms_in_collection_by_key_value_with_selected_fields(self, installed_dbs):
         import esgvoc.api.projects as projects
 
@@ -0,0 +1,252 @@
+"""
+Tests for esgvoc.api.projects (and the instantiation of its terms by esgvoc.api.search) that run offline,
+on tiny universe and project databases built in an isolated ESGVOC_HOME.
+"""
+
+import re
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session
+
+from esgvoc.core.db.connection import DBConnection
+from esgvoc.core.db.models.mixins import TermKind
+from esgvoc.core.db.models.project import PCollection, Project, PTerm, project_create_db
+from esgvoc.core.db.models.universe import UDataDescriptor, Universe, UTerm, universe_create_db
+from esgvoc.core.exceptions import EsgvocDbError, EsgvocNotFoundError
+from esgvoc.core.service.user_state import UserState
+
+FREQUENCIES = [
+    {"id": "mon", "type": "frequency", "drs_name": "mon", "interval": 1.0, "units": "month", "description": "monthly"},
+    {"id": "day", "type": "frequency", "drs_name": "day", "interval": 1.0, "units": "day", "description": "daily"},
+]
+
+CONTACTS = [
+    {"id": "lower_abc", "type": "contact", "regex": "abc", "description": "lower case abc"},
+    {"id": "any_case_xyz", "type": "contact", "regex": "(?i)xyz", "description": "xyz in any case"},
+]
+
+# Terms by collection (which is also its data descriptor).
+COLLECTIONS = {"frequency": (TermKind.PLAIN, FREQUENCIES), "contact": (TermKind.PATTERN, CONTACTS)}
+
+PROJECT_IDS = ["proj_a", "proj_b"]
+
+
+def _build_universe() -> None:
+    db_path = UserState.db_path("universe", "v1")
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    universe_create_db(db_path)
+    with Session(DBConnection(db_path).get_engine()) as session:
+        universe = Universe(git_hash="universe")
+        for data_descriptor_id, (term_kind, terms) in COLLECTIONS.items():
+            data_descriptor = UDataDescriptor(id=data_descriptor_id, context={}, universe=universe, term_kind=term_kind)
+            session.add(data_descriptor)
+            for specs in terms:
+                session.add(UTerm(id=specs["id"], specs=specs, kind=term_kind, data_descriptor=data_descriptor))
+        session.commit()
+    UserState.load().set_active("universe", "v1")
+
+
+def _build_project(project_id: str, collections: dict = COLLECTIONS) -> None:
+    db_path = UserState.db_path(project_id, "v1")
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    project_create_db(db_path)
+    with Session(DBConnection(db_path).get_engine()) as session:
+        project_specs = {"project_id": project_id, "description": project_id, "drs_name": project_id.upper()}
+        project = Project(id=project_id, specs=project_specs, git_hash=project_id)
+        for collection_id, (term_kind, terms) in collections.items():
+            collection = PCollection(
+                id=collection_id, data_descriptor_id=collection_id, context={}, project=project, term_kind=term_kind
+            )
+            session.add(collection)
+            for specs in terms:
+                session.add(PTerm(id=specs["id"], specs=specs, kind=term_kind, collection=collection))
+        # Build metadata, as embedded by the builder.
+        session.execute(text("CREATE TABLE _esgvoc_metadata (key TEXT PRIMARY KEY NOT NULL, value TEXT)"))
+        session.execute(text("INSERT INTO _esgvoc_metadata VALUES ('cv_version', 'v1')"))
+        session.commit()
+    UserState.load().set_active(project_id, "v1")
+
+
+@pytest.fixture
+def tiny_dbs(tmp_path, monkeypatch):
+    from esgvoc.api import projects
+
+    monkeypatch.setenv("ESGVOC_HOME", str(tmp_path))
+    monkeypatch.delenv("ESGVOC_DB_DIR", raising=False)
+    monkeypatch.delenv("ESGVOC_RE2", raising=False)
+    projects.clear_caches()
+    _build_universe()
+    for project_id in PROJECT_IDS:
+        _build_project(project_id)
+    yield tmp_path
+    projects.clear_caches()
+
+
+class TestValidTermsInAllProjects:
+    def test_matches_each_value_in_all_projects(self, tiny_dbs):
+        from esgvoc.api import projects
+
+        results = projects.valid_terms_in_all_projects(["mon", "not_a_frequency", "mon"])
+        assert list(results) == ["mon", "not_a_frequency"]
+        assert [(m.project_id, m.collection_id, m.term_id) for m in results["mon"]] == [
+            (project_id, "frequency", "mon") for project_id in PROJECT_IDS
+        ]
+        assert results["not_a_frequency"] == []
+        for value, matching_terms in results.items():
+            assert matching_terms == projects.valid_term_in_all_projects(value)
+
+    def test_no_value(self, tiny_dbs):
+        from esgvoc.api import projects
+
+        assert projects.valid_terms_in_all_projects([]) == {}
+
+
+class TestValidTermInPlainCollection:
+    def test_drs_name_shared_by_two_terms(self, tiny_dbs):
+        from esgvoc.api import projects
+
+        monthly = {**FREQUENCIES[0], "id": "monthly"}
+        _build_project("proj_dup", {"frequency": (TermKind.PLAIN, [*FREQUENCIES, monthly])})
+        assert [m.term_id for m in projects.valid_term_in_collection("day", "proj_dup", "frequency")] == ["day"]
+        with pytest.raises(EsgvocDbError):
+            projects.valid_term_in_collection("mon", "proj_dup", "frequency")
+        with pytest.raises(EsgvocDbError):
+            projects.valid_term_in_project("mon", "proj_dup")
+
+
+class TestValidTermInCompositeCollection:
+    def test_missing_part_term_is_reported_when_reached(self, tiny_dbs):
+        from esgvoc.api import projects
+
+        member = {
+            "id": "member",
+            "type": "member_id",
+            "separator": "_",
+            "parts": [
+                {"type": "frequency", "id": "mon", "is_required": True},
+                {"type": "frequency", "id": "not_a_frequency", "is_required": True},
+            ],
+            "description": "a composite whose second part doesn't exist",
+        }
+        _build_project("proj_comp", {"member_id": (TermKind.COMPOSITE, [member])})
+        # The first part doesn't match: the second one is never reached.
+        assert projects.valid_term_in_collection("day_x", "proj_comp", "member_id") == []
+        with pytest.raises(EsgvocNotFoundError):
+            projects.valid_term_in_collection("mon_x", "proj_comp", "member_id")
+
+
+class TestValidTermInPatternCollection:
+    def test_inline_flag_applies_to_its_own_pattern(self, tiny_dbs):
+        from esgvoc.api import projects
+
+        # A merged alternation would spread the (?i) flag of one pattern over the others.
+        assert projects._compile_pattern_alternation([specs["regex"] for specs in CONTACTS]) is None
+        assert [m.term_id for m in projects.valid_term_in_collection("abc", "proj_a", "contact")] == ["lower_abc"]
+        assert projects.valid_term_in_collection("ABC", "proj_a", "contact") == []
+        assert [m.term_id for m in projects.valid_term_in_collection("XYZ", "proj_a", "contact")] == ["any_case_xyz"]
+
+
+class TestRegexEngine:
+    VALUES = ["abc", "abc\n", "ABC", "xyz", "XyZ", "xyz\n", "ab"]
+
+    @staticmethod
+    def _verdicts(projects) -> list[list[str]]:
+        return [
+            [m.term_id for m in projects.valid_term_in_collection(value, "proj_a", "contact")]
+            for value in TestRegexEngine.VALUES
+        ]
+
+    def test_re_by_default(self, tiny_dbs):
+        from esgvoc.api import projects
+
+        assert isinstance(projects._compile("abc"), re.Pattern)
+
+    def test_re2_gives_the_same_verdicts(self, tiny_dbs, monkeypatch):
+        pytest.importorskip("re2")
+        from esgvoc.api import projects
+
+        re_verdicts = self._verdicts(projects)
+        monkeypatch.setenv("ESGVOC_RE2", "true")
+        projects.clear_caches()
+        assert not isinstance(projects._compile("abc"), re.Pattern)
+        assert self._verdicts(projects) == re_verdicts
+
+
+class TestGetProject:
+    def test_failed_lookup_is_not_cached(self, tiny_dbs, monkeypatch):
+        from esgvoc.api import projects
+
+        project_specs_class = projects.ProjectSpecs
+        calls = list()
+
+        def _project_specs_failing_once(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                raise RuntimeError("database is locked")
+            return project_specs_class(**kwargs)
+
+        monkeypatch.setattr(projects, "ProjectSpecs", _project_specs_failing_once)
+        assert projects.get_project("proj_a") is None
+        project_specs = projects.get_project("proj_a")
+        assert project_specs is not None
+        assert (project_specs.project_id, project_specs.version) == ("proj_a", "v1")
+
+
+class TestInvalidTerm:
+    def test_error_names_the_data_descriptor(self, tiny_dbs):
+        from esgvoc.api import projects
+
+        invalid = {**FREQUENCIES[0], "id": "invalid", "interval": "often"}
+        _build_project("proj_invalid", {"frequency": (TermKind.PLAIN, [invalid])})
+        for get_terms in (
+            lambda: projects.get_term_in_project("proj_invalid", "invalid"),
+            lambda: projects.get_all_terms_in_collection("proj_invalid", "frequency"),
+            lambda: projects.get_all_terms_in_project("proj_invalid"),
+        ):
+            with pytest.raises(ValueError, match="ID: 'invalid', type: 'frequency', data_descriptor: 'frequency'"):
+                get_terms()
+
+
+class TestLookupResultsCache:
+    def test_second_call_is_served_from_the_cache(self, tiny_dbs, monkeypatch):
+        from esgvoc.api import projects
+
+        first = projects.get_term_in_project("proj_a", "mon")
+        assert first is not None
+
+        def _no_session(self):
+            raise AssertionError("the database was queried again")
+
+        monkeypatch.setattr(DBConnection, "create_session", _no_session)
+        second = projects.get_term_in_project("proj_a", "mon")
+        assert second == first
+        # The callers receive copies of the cached results.
+        assert second is not first
+        second.description = "changed"
+        assert projects.get_term_in_project("proj_a", "mon") == first
+
+
+class TestInstantiatePydanticTerms:
+    @staticmethod
+    def _pterms(terms: list[dict]) -> list[PTerm]:
+        return [PTerm(id=specs["id"], specs=specs, kind=TermKind.PLAIN) for specs in terms]
+
+    def test_invalid_term_is_reported(self):
+        from esgvoc.api import search
+
+        invalid = {**FREQUENCIES[0], "id": "invalid", "interval": "often"}
+        terms = list()
+        with pytest.raises(ValueError, match="ID: 'invalid'"):
+            search.instantiate_pydantic_terms(self._pterms([FREQUENCIES[1], invalid]), terms, None)
+        assert [term.id for term in terms] == ["day"]
+
+    def test_programming_error_is_not_swallowed(self, monkeypatch):
+        from esgvoc.api import search
+
+        def _broken_adapter(term_type):
+            raise TypeError("broken adapter")
+
+        monkeypatch.setattr(search, "get_pydantic_list_type_adapter", _broken_adapter)
+        with pytest.raises(TypeError, match="broken adapter"):
+            search.instantiate_pydantic_terms(self._pterms(FREQUENCIES), list(), None)
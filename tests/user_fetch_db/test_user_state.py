@@ -50,6 +50,23 @@ class TestActivePointer:
         state = UserState.load()
         state.remove_active("doesnotexist")  # must not raise
 
+    def test_pointer_rewritten_by_another_process_is_read_again(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ESGVOC_HOME", str(tmp_path))
+        state = UserState.load()
+        state.set_active("cmip7", "v1.0.0")
+        assert state.get_active("cmip7") == "v1.0.0"
+        pointer = tmp_path / "dbs" / "cmip7.active.json"
+        pointer.write_text(json.dumps({"active": "v2.0.0-rc", "source": "local"}))
+        assert state.get_active("cmip7") == "v2.0.0-rc"
+        assert state.get_active_source("cmip7") == "local"
+
+    def test_corrupt_pointer_returns_none(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ESGVOC_HOME", str(tmp_path))
+        pointer = tmp_path / "dbs" / "cmip7.active.json"
+        pointer.parent.mkdir(parents=True, exist_ok=True)
+        pointer.write_text("[]")
+        assert UserState.load().get_active("cmip7") is None
+
     def test_save_is_noop(self):
         state = UserState.load()
         state.set_active("cmip7", "v1.0.0")
@@ -132,6 +149,15 @@ class TestAllProjectIds:
         empty.mkdir(parents=True)
         assert UserState.load().all_project_ids() == []
 
+    def test_sees_db_files_added_and_removed_after_a_scan(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ESGVOC_HOME", str(tmp_path))
+        UserState.load().add_installed("cmip7", "v1.0.0")
+        assert UserState.load().all_project_ids() == []
+        make_db(UserState.db_path("cmip7", "v1.0.0"), "cmip7")
+        assert UserState.load().all_project_ids() == ["cmip7"]
+        UserState.load().remove_installed("cmip7", "v1.0.0")
+        assert UserState.load().all_project_ids() == []
+
 
 class TestDbPath:
     def test_db_path_structure(self, tmp_path, monkeypatch):
@@ -159,3 +185,41 @@ class TestDump:
         d = state.dump()
         assert "cmip7" in d["installed"]
         assert d["active_versions"]["cmip7"] == "v1.0.0"
+
+
+class TestStateChangeListeners:
+    def _listen(self, monkeypatch) -> list[str]:
+        import esgvoc.core.service.user_state as user_state
+
+        notified: list[str] = []
+        monkeypatch.setattr(user_state, "_STATE_CHANGE_LISTENERS", [])
+        user_state.add_state_change_listener(notified.append)
+        user_state.add_state_change_listener(notified.append)  # registered once
+        return notified
+
+    def test_set_and_remove_active_notify(self, monkeypatch):
+        notified = self._listen(monkeypatch)
+        state = UserState.load()
+        state.set_active("cmip7", "v1.0.0")
+        state.remove_active("cmip7")
+        assert notified == ["cmip7", "cmip7"]
+
+    def test_remove_installed_notifies(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ESGVOC_HOME", str(tmp_path))
+        make_db(UserState.db_path("cmip7", "v1.0.0"))
+        notified = self._listen(monkeypatch)
+        UserState.load().remove_installed("cmip7", "v1.0.0")
+        assert notified == ["cmip7"]
+
+    def test_failing_listener_does_not_break_state(self, monkeypatch):
+        import esgvoc.core.service.user_state as user_state
+
+        def _fail(project_id: str) -> None:
+            raise RuntimeError(project_id)
+
+        notified = self._listen(monkeypatch)
+        user_state._STATE_CHANGE_LISTENERS.insert(0, _fail)
+        state = UserState.load()
+        state.set_active("cmip7", "v1.0.0")
+        assert state.get_active("cmip7") == "v1.0.0"
+        assert notified == ["cmip7"]